@@ -58,6 +58,8 @@ interface AveragedMetric {
 export class MetricsComponent implements OnInit {
   metrics: ImageMetric[] = [];
   averagedMetrics: AveragedMetric[] = [];
+  // Metric columns with at least one valid averaged value, rebuilt by prepareChartData
+  private availableMetricColumns = new Set<keyof AveragedMetric['metrics']>();
   loading: boolean = false;
   viewMode: ViewMode = 'both';
   viewOptions: ViewOption[] = [
@@ -222,6 +224,7 @@ export class MetricsComponent implements OnInit {
         this.radarColorReferenceChartData = null;
         this.higherBetterAreaChartData = null;
         this.averagedMetrics = [];
+        this.availableMetricColumns.clear();
         return;
     }
 
@@ -237,45 +240,66 @@ export class MetricsComponent implements OnInit {
     const models = Object.keys(groupedMetrics);
 
     // 2. Calculate averages for each model
+    // Color-difference metrics are stored as { mean } objects, the rest as plain numbers
+    const scalarMetricKeys = ['psnr', 'ssim', 'niqe', 'brisque', 'loe', 'lpips'] as const;
+    const meanMetricKeys = [
+      'delta_e76_vs_original',
+      'delta_e76_vs_reference',
+      'ciede2000_vs_original',
+      'ciede2000_vs_reference',
+      'angular_error_vs_original',
+      'angular_error_vs_reference'
+    ] as const;
+    const metricCount = scalarMetricKeys.length + meanMetricKeys.length;
+
     this.averagedMetrics = models.map(model => {
       const metricsList = groupedMetrics[model];
-      const count = metricsList.length;
-
-      // Helper function to safely average a metric
-      const safeAverage = (getValue: (m: ImageMetric) => number | undefined): number | undefined => {
-        const values = metricsList
-          .map(getValue)
-          .filter((v): v is number => v !== undefined && v !== null && !isNaN(v));
-        
-        if (values.length === 0) return undefined;
-        return values.reduce((a, b) => a + b, 0) / values.length;
+      const sums = new Array<number>(metricCount).fill(0);
+      const counts = new Array<number>(metricCount).fill(0);
+
+      // Accumulate every metric in a single pass over the model's images,
+      // skipping missing or NaN values
+      const accumulate = (index: number, value: number | undefined) => {
+        if (value !== undefined && value !== null && !isNaN(value)) {
+          sums[index] += value;
+          counts[index]++;
+        }
       };
 
-      // Helper function to create mean metric object
-      const createMeanMetric = (getValue: (m: ImageMetric) => number | undefined): { mean: number } | undefined => {
-        const avg = safeAverage(getValue);
-        return avg !== undefined ? { mean: avg } : undefined;
-      };
+      for (const m of metricsList) {
+        scalarMetricKeys.forEach((key, i) => accumulate(i, m.metrics[key]));
+        meanMetricKeys.forEach((key, i) => accumulate(scalarMetricKeys.length + i, m.metrics[key]?.mean));
+      }
+
+      const average = (index: number): number | undefined =>
+        counts[index] > 0 ? sums[index] / counts[index] : undefined;
+
+      const averaged: AveragedMetric['metrics'] = {};
+      scalarMetricKeys.forEach((key, i) => {
+        averaged[key] = average(i);
+      });
+      meanMetricKeys.forEach((key, i) => {
+        const avg = average(scalarMetricKeys.length + i);
+        averaged[key] = avg !== undefined ? { mean: avg } : undefined;
+      });
 
       return {
         model,
-        metrics: {
-          psnr: safeAverage(m => m.metrics.psnr),
-          ssim: safeAverage(m => m.metrics.ssim),
-          niqe: safeAverage(m => m.metrics.niqe),
-          brisque: safeAverage(m => m.metrics.brisque),
-          loe: safeAverage(m => m.metrics.loe),
-          lpips: safeAverage(m => m.metrics.lpips),
-          delta_e76_vs_original: createMeanMetric(m => m.metrics.delta_e76_vs_original?.mean),
-          delta_e76_vs_reference: createMeanMetric(m => m.metrics.delta_e76_vs_reference?.mean),
-          ciede2000_vs_original: createMeanMetric(m => m.metrics.ciede2000_vs_original?.mean),
-          ciede2000_vs_reference: createMeanMetric(m => m.metrics.ciede2000_vs_reference?.mean),
-          angular_error_vs_original: createMeanMetric(m => m.metrics.angular_error_vs_original?.mean),
-          angular_error_vs_reference: createMeanMetric(m => m.metrics.angular_error_vs_reference?.mean)
-        }
+        metrics: averaged
       };
     });
 
+    // Probe metric availability once; charts and template columns read the cached set
+    this.availableMetricColumns = new Set(
+      [...scalarMetricKeys, ...meanMetricKeys].filter(metricName =>
+        this.averagedMetrics.some(m => {
+          const val = m.metrics[metricName];
+          return val !== undefined && val !== null &&
+            (typeof val === 'number' ? !isNaN(val) : !isNaN(val.mean));
+        })
+      )
+    );
+
     const baseColors = [
       'rgba(59, 130, 246, 0.7)',   // Blue
       'rgba(16, 185, 129, 0.7)',   // Green
@@ -292,12 +316,7 @@ export class MetricsComponent implements OnInit {
     const borderColors = chartColors.map(c => c.replace('0.7', '1'));
 
     // Helper function to check if any model has this metric
-    const hasMetric = (getter: (m: AveragedMetric) => number | { mean: number } | undefined): boolean => {
-      return this.averagedMetrics.some(m => {
-        const val = getter(m);
-        return val !== undefined && val !== null && (typeof val === 'number' ? !isNaN(val) : !isNaN(val.mean));
-      });
-    };
+    const hasMetric = (metricName: keyof AveragedMetric['metrics']): boolean => this.hasMetricColumn(metricName);
 
     // Helper function to get metric value safely
     const getMetricValue = (m: AveragedMetric, getter: (m: AveragedMetric) => number | { mean: number } | undefined): number | null => {
@@ -308,7 +327,7 @@ export class MetricsComponent implements OnInit {
     };
 
     // PSNR Chart (Higher is better)
-    if (hasMetric(m => m.metrics.psnr)) {
+    if (hasMetric('psnr')) {
       this.psnrChartData = {
         labels: models,
         datasets: [{
@@ -324,7 +343,7 @@ export class MetricsComponent implements OnInit {
     }
 
     // SSIM Chart (Higher is better)
-    if (hasMetric(m => m.metrics.ssim)) {
+    if (hasMetric('ssim')) {
       this.ssimChartData = {
         labels: models,
         datasets: [{
@@ -340,7 +359,7 @@ export class MetricsComponent implements OnInit {
     }
 
     // NIQE Chart (Lower is better)
-    if (hasMetric(m => m.metrics.niqe)) {
+    if (hasMetric('niqe')) {
       this.niqeChartData = {
         labels: models,
         datasets: [{
@@ -356,7 +375,7 @@ export class MetricsComponent implements OnInit {
     }
 
     // BRISQUE Chart (Lower is better)
-    if (hasMetric(m => m.metrics.brisque)) {
+    if (hasMetric('brisque')) {
       this.brisqueChartData = {
         labels: models,
         datasets: [{
@@ -372,7 +391,7 @@ export class MetricsComponent implements OnInit {
     }
 
     // LOE Chart (Lower is better)
-    if (hasMetric(m => m.metrics.loe)) {
+    if (hasMetric('loe')) {
       this.loeChartData = {
         labels: models,
         datasets: [{
@@ -388,7 +407,7 @@ export class MetricsComponent implements OnInit {
     }
 
     // LPIPS Chart (Lower is better)
-    if (hasMetric(m => m.metrics.lpips)) {
+    if (hasMetric('lpips')) {
       this.lpipsChartData = {
         labels: models,
         datasets: [{
@@ -404,7 +423,7 @@ export class MetricsComponent implements OnInit {
     }
 
     // Delta E76 vs Original Chart (Lower is better)
-    if (hasMetric(m => m.metrics.delta_e76_vs_original)) {
+    if (hasMetric('delta_e76_vs_original')) {
       this.deltaE76OriginalChartData = {
         labels: models,
         datasets: [{
@@ -420,7 +439,7 @@ export class MetricsComponent implements OnInit {
     }
 
     // Delta E76 vs Reference Chart (Lower is better)
-    if (hasMetric(m => m.metrics.delta_e76_vs_reference)) {
+    if (hasMetric('delta_e76_vs_reference')) {
       this.deltaE76ReferenceChartData = {
         labels: models,
         datasets: [{
@@ -436,7 +455,7 @@ export class MetricsComponent implements OnInit {
     }
 
     // CIEDE2000 vs Original Chart (Lower is better)
-    if (hasMetric(m => m.metrics.ciede2000_vs_original)) {
+    if (hasMetric('ciede2000_vs_original')) {
       this.ciede2000OriginalChartData = {
         labels: models,
         datasets: [{
@@ -452,7 +471,7 @@ export class MetricsComponent implements OnInit {
     }
 
     // CIEDE2000 vs Reference Chart (Lower is better)
-    if (hasMetric(m => m.metrics.ciede2000_vs_reference)) {
+    if (hasMetric('ciede2000_vs_reference')) {
       this.ciede2000ReferenceChartData = {
         labels: models,
         datasets: [{
@@ -468,7 +487,7 @@ export class MetricsComponent implements OnInit {
     }
 
     // Angular Error vs Original Chart (Lower is better)
-    if (hasMetric(m => m.metrics.angular_error_vs_original)) {
+    if (hasMetric('angular_error_vs_original')) {
       this.angularErrorOriginalChartData = {
         labels: models,
         datasets: [{
@@ -484,7 +503,7 @@ export class MetricsComponent implements OnInit {
     }
 
     // Angular Error vs Reference Chart (Lower is better)
-    if (hasMetric(m => m.metrics.angular_error_vs_reference)) {
+    if (hasMetric('angular_error_vs_reference')) {
       this.angularErrorReferenceChartData = {
         labels: models,
         datasets: [{
@@ -509,14 +528,29 @@ export class MetricsComponent implements OnInit {
         return min / val;
     };
 
+    // Normalize a set of lower-is-better metrics for the radar charts.
+    // Values are read once into a models x metrics matrix and the per-metric
+    // minimum is tracked in the same pass, instead of re-scanning every model per metric.
+    const normalizeLowerBetterColumns = (metricKeys: readonly (keyof AveragedMetric['metrics'])[]): number[][] => {
+      const mins = metricKeys.map(() => Infinity);
+      const rows = this.averagedMetrics.map(am => metricKeys.map((metric, col) => {
+        const val = getMetricValue(am, m => m.metrics[metric]);
+        if (val !== null && val < mins[col]) mins[col] = val;
+        return val;
+      }));
+      return rows.map(row => row.map((val, col) =>
+        val !== null ? normalizeLowerBetter(val, mins[col] === Infinity ? 0 : mins[col]) : 0
+      ));
+    };
+
     // ============================================
     // 1️⃣ Area Chart - Higher is Better (PSNR & SSIM)
     // ============================================
-    const hasPsnrOrSsim = hasMetric(m => m.metrics.psnr) || hasMetric(m => m.metrics.ssim);
+    const hasPsnrOrSsim = hasMetric('psnr') || hasMetric('ssim');
     if (hasPsnrOrSsim) {
       const labels: string[] = [];
-      if (hasMetric(m => m.metrics.psnr)) labels.push('PSNR');
-      if (hasMetric(m => m.metrics.ssim)) labels.push('SSIM');
+      if (hasMetric('psnr')) labels.push('PSNR');
+      if (hasMetric('ssim')) labels.push('SSIM');
 
       const areaDatasets = this.averagedMetrics.map((am, index) => {
         const color = baseColors[index % baseColors.length];
@@ -524,8 +558,8 @@ export class MetricsComponent implements OnInit {
         const bgColor = color.replace('0.7', '0.3');
 
         const data: (number | null)[] = [];
-        if (hasMetric(m => m.metrics.psnr)) data.push(getMetricValue(am, m => m.metrics.psnr));
-        if (hasMetric(m => m.metrics.ssim)) data.push(getMetricValue(am, m => m.metrics.ssim));
+        if (hasMetric('psnr')) data.push(getMetricValue(am, m => m.metrics.psnr));
+        if (hasMetric('ssim')) data.push(getMetricValue(am, m => m.metrics.ssim));
 
         return {
             label: am.model,
@@ -553,13 +587,13 @@ export class MetricsComponent implements OnInit {
     // ============================================
     const qualityMetrics = ['niqe', 'brisque', 'loe', 'lpips'] as const;
     const hasQualityMetrics = qualityMetrics.some(metric => 
-      hasMetric(m => m.metrics[metric])
+      hasMetric(metric)
     );
 
     if (hasQualityMetrics) {
       // Build labels and data dynamically based on available metrics
       const availableQualityMetrics = qualityMetrics.filter(metric => 
-        hasMetric(m => m.metrics[metric])
+        hasMetric(metric)
       );
       
       const qualityLabels = availableQualityMetrics.map(metric => {
@@ -572,23 +606,14 @@ export class MetricsComponent implements OnInit {
         return labelMap[metric];
       });
 
-      const minValuesQuality: Record<string, number> = {};
-      availableQualityMetrics.forEach(metric => {
-        const values = this.averagedMetrics
-          .map(m => getMetricValue(m, m => m.metrics[metric]))
-          .filter((v): v is number => v !== null);
-        minValuesQuality[metric] = values.length > 0 ? Math.min(...values) : 0;
-      });
+      const normalizedQuality = normalizeLowerBetterColumns(availableQualityMetrics);
 
       const radarQualityDatasets = this.averagedMetrics.map((am, index) => {
         const color = baseColors[index % baseColors.length];
         const borderColor = color.replace('0.7', '1');
         const bgColor = color.replace('0.7', '0.2');
 
-        const data = availableQualityMetrics.map(metric => {
-          const val = getMetricValue(am, m => m.metrics[metric]);
-          return val !== null ? normalizeLowerBetter(val, minValuesQuality[metric]) : 0;
-        });
+        const data = normalizedQuality[index];
 
         return {
             label: am.model,
@@ -612,12 +637,12 @@ export class MetricsComponent implements OnInit {
     // ============================================
     const colorOriginalMetrics = ['delta_e76_vs_original', 'ciede2000_vs_original', 'angular_error_vs_original'] as const;
     const hasColorOriginalMetrics = colorOriginalMetrics.some(metric => 
-      hasMetric(m => m.metrics[metric])
+      hasMetric(metric)
     );
 
     if (hasColorOriginalMetrics) {
       const availableColorOriginalMetrics = colorOriginalMetrics.filter(metric => 
-        hasMetric(m => m.metrics[metric])
+        hasMetric(metric)
       );
       
       const colorOriginalLabels = availableColorOriginalMetrics.map(metric => {
@@ -629,23 +654,14 @@ export class MetricsComponent implements OnInit {
         return labelMap[metric];
       });
 
-      const minValuesColorOriginal: Record<string, number> = {};
-      availableColorOriginalMetrics.forEach(metric => {
-        const values = this.averagedMetrics
-          .map(m => getMetricValue(m, m => m.metrics[metric]))
-          .filter((v): v is number => v !== null);
-        minValuesColorOriginal[metric] = values.length > 0 ? Math.min(...values) : 0;
-      });
+      const normalizedColorOriginal = normalizeLowerBetterColumns(availableColorOriginalMetrics);
 
       const radarColorOriginalDatasets = this.averagedMetrics.map((am, index) => {
         const color = baseColors[index % baseColors.length];
         const borderColor = color.replace('0.7', '1');
         const bgColor = color.replace('0.7', '0.2');
 
-        const data = availableColorOriginalMetrics.map(metric => {
-          const val = getMetricValue(am, m => m.metrics[metric]);
-          return val !== null ? normalizeLowerBetter(val, minValuesColorOriginal[metric]) : 0;
-        });
+        const data = normalizedColorOriginal[index];
 
         return {
             label: am.model,
@@ -669,12 +685,12 @@ export class MetricsComponent implements OnInit {
     // ============================================
     const colorReferenceMetrics = ['delta_e76_vs_reference', 'ciede2000_vs_reference', 'angular_error_vs_reference'] as const;
     const hasColorReferenceMetrics = colorReferenceMetrics.some(metric => 
-      hasMetric(m => m.metrics[metric])
+      hasMetric(metric)
     );
 
     if (hasColorReferenceMetrics) {
       const availableColorReferenceMetrics = colorReferenceMetrics.filter(metric => 
-        hasMetric(m => m.metrics[metric])
+        hasMetric(metric)
       );
       
       const colorReferenceLabels = availableColorReferenceMetrics.map(metric => {
@@ -686,23 +702,14 @@ export class MetricsComponent implements OnInit {
         return labelMap[metric];
       });
 
-      const minValuesColorReference: Record<string, number> = {};
-      availableColorReferenceMetrics.forEach(metric => {
-        const values = this.averagedMetrics
-          .map(m => getMetricValue(m, m => m.metrics[metric]))
-          .filter((v): v is number => v !== null);
-        minValuesColorReference[metric] = values.length > 0 ? Math.min(...values) : 0;
-      });
+      const normalizedColorReference = normalizeLowerBetterColumns(availableColorReferenceMetrics);
 
       const radarColorReferenceDatasets = this.averagedMetrics.map((am, index) => {
         const color = baseColors[index % baseColors.length];
         const borderColor = color.replace('0.7', '1');
         const bgColor = color.replace('0.7', '0.2');
 
-        const data = availableColorReferenceMetrics.map(metric => {
-          const val = getMetricValue(am, m => m.metrics[metric]);
-          return val !== null ? normalizeLowerBetter(val, minValuesColorReference[metric]) : 0;
-        });
+        const data = normalizedColorReference[index];
 
         return {
             label: am.model,
@@ -741,13 +748,10 @@ export class MetricsComponent implements OnInit {
 
   /**
    * Check if any averaged metric has a specific field
+   * Uses the availability set cached by prepareChartData, so template bindings stay O(1)
    */
   hasMetricColumn(metricName: keyof AveragedMetric['metrics']): boolean {
-    return this.averagedMetrics.some(m => {
-      const val = m.metrics[metricName];
-      return val !== undefined && val !== null && 
-        (typeof val === 'number' ? !isNaN(val) : !isNaN(val.mean));
-    });
+    return this.availableMetricColumns.has(metricName);
   }
 
   /**